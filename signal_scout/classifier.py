@@ -15,6 +15,7 @@ from sklearn.naive_bayes import MultinomialNB
 from sklearn.pipeline import Pipeline
 from sklearn.compose import ColumnTransformer
 from sklearn.preprocessing import StandardScaler
+import joblib
 import pickle
 import os
 from urllib.parse import urlparse
@@ -68,10 +69,15 @@ class StreamingSiteClassifier:
         """Load the trained model if it exists."""
         try:
             if os.path.exists(self.model_path):
-                with open(self.model_path, 'rb') as f:
-                    model_data = pickle.load(f)
-                    self.model = model_data['model']
-                    self.feature_names = model_data.get('feature_names', [])
+                try:
+                    # Current model files are joblib archives (see train_model)
+                    model_data = joblib.load(self.model_path)
+                except Exception:
+                    # Older model files were written with raw pickle
+                    with open(self.model_path, 'rb') as f:
+                        model_data = pickle.load(f)
+                self.model = model_data['model']
+                self.feature_names = model_data.get('feature_names', [])
                 logger.info(f"Loaded trained model from {self.model_path}")
             else:
                 logger.warning(f"No trained model found at {self.model_path}")
@@ -82,17 +88,21 @@ class StreamingSiteClassifier:
     def extract_features(self, html_content, url=""):
         """
         Extract comprehensive feature vector from HTML content and URL.
-        
+
         Args:
-            html_content (str): Full HTML content of the page
+            html_content (str or bytes): Full HTML content of the page; raw
+                response bytes are accepted so callers can skip decoding when
+                the classifier is the only consumer of the body
             url (str): URL of the page
-            
+
         Returns:
             dict: Feature dictionary with named features and values
         """
         features = {}
-        
+
         try:
+            if isinstance(html_content, bytes):
+                html_content = html_content.decode('utf-8', 'ignore')
             soup = BeautifulSoup(html_content, 'html.parser')
             text_content = soup.get_text().lower()
             url_lower = url.lower()
@@ -212,9 +222,9 @@ class StreamingSiteClassifier:
     def classify_page(self, html_content, url=""):
         """
         Classify a page as streaming site or not with probability score.
-        
+
         Args:
-            html_content (str): HTML content of the page
+            html_content (str or bytes): HTML content of the page
             url (str): URL of the page
             
         Returns:
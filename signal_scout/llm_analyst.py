@@ -10,6 +10,8 @@ import os
 import json
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Optional, Any
 from dotenv import load_dotenv
 
@@ -37,6 +39,27 @@ class LLMAnalyst:
         self.config = self._load_config(config_path)
         self.api_key = self._get_api_key()
         self.headers = self._setup_headers()
+        self.session = self._setup_session()
+
+    def _setup_session(self) -> requests.Session:
+        """
+        Create a pooled HTTP session reused across all analysis calls.
+
+        Keeping one Session alive means consecutive inference requests reuse
+        the same TCP/TLS connection instead of paying a fresh handshake per
+        verified URL, and the auth headers are attached once.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=8,
+            max_retries=Retry(total=1, backoff_factor=0.2)
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        if self.headers:
+            session.headers.update(self.headers)
+        return session
 
     def _load_config(self, config_path: Optional[str] = None) -> Dict[str, Any]:
         """Load LLM configuration from JSON file."""
@@ -150,9 +173,8 @@ class LLMAnalyst:
             # Make the Hugging Face API request
             logger.info(f"V6.0 Cognitive Analysis: Sending structured reasoning request to Hugging Face for: {url}")
 
-            response = requests.post(
+            response = self.session.post(
                 f"{api_url}/models/{model_name}",
-                headers=self.headers,
                 json=payload,
                 timeout=llm_settings.get('timeout', 30)
             )
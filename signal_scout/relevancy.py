@@ -0,0 +1,137 @@
+"""
+Shared relevancy scoring for the Signal Scout focused crawlers.
+
+The spiders score every extracted link for streaming/sports indicators. The
+keyword tables live here as module constants compiled into multi-pattern
+alternations — CPython's sre engine compiles these into a prefix trie, so each
+string is scanned once at C level instead of once per keyword.
+"""
+
+import re
+from bisect import bisect_right
+
+import numpy as np
+
+# Anchor-text keyword weights: streaming terms score higher than sports terms
+TEXT_KEYWORD_WEIGHTS = {
+    'live': 0.3, 'stream': 0.3, 'watch': 0.3, 'tv': 0.3, 'video': 0.3,
+    'player': 0.3, 'free': 0.3,
+    'nfl': 0.2, 'nba': 0.2, 'nhl': 0.2, 'mlb': 0.2, 'soccer': 0.2,
+    'football': 0.2, 'basketball': 0.2, 'sports': 0.2,
+}
+
+# URL keyword weights mirror the text table at reduced strength
+URL_KEYWORD_WEIGHTS = {
+    'live': 0.2, 'stream': 0.2, 'watch': 0.2, 'tv': 0.2, 'video': 0.2,
+    'player': 0.2, 'free': 0.2,
+    'nfl': 0.15, 'nba': 0.15, 'nhl': 0.15, 'mlb': 0.15, 'soccer': 0.15,
+    'football': 0.15, 'basketball': 0.15, 'sports': 0.15,
+}
+
+# Longest-first alternation so compound keywords win over their substrings
+KEYWORD_RE = re.compile(
+    '|'.join(sorted(TEXT_KEYWORD_WEIGHTS, key=len, reverse=True))
+)
+
+NEGATIVE_RE = re.compile(r'privacy|terms|contact|about|dmca|legal|cookie')
+
+# Specific streaming indicators that earn a URL bonus
+URL_BONUS_KEYWORDS = frozenset({'live', 'stream', 'watch'})
+
+
+def calculate_relevancy_score(link_text, url):
+    """
+    Score a single link for sports/streaming relevancy, clamped to [0, 1].
+
+    Each string costs one lowercase plus one pass per compiled pattern; every
+    keyword contributes at most once per string (presence, not count). Links
+    carrying two or more distinct negative indicators score 0 outright.
+    """
+    text_lower = link_text.lower() if link_text else ""
+    url_lower = url.lower()
+
+    # Negative indicators first: boilerplate nav links ("privacy policy",
+    # "contact us") dominate real pages, and two distinct hits sink a link,
+    # so the keyword scans are skipped for them entirely
+    negative_hits = set(NEGATIVE_RE.findall(url_lower))
+    negative_hits.update(NEGATIVE_RE.findall(text_lower))
+    if len(negative_hits) >= 2:
+        return 0.0
+
+    score = -0.5 * len(negative_hits)
+
+    for keyword in set(KEYWORD_RE.findall(text_lower)):
+        score += TEXT_KEYWORD_WEIGHTS[keyword]
+
+    url_hits = set(KEYWORD_RE.findall(url_lower))
+    for keyword in url_hits:
+        score += URL_KEYWORD_WEIGHTS[keyword]
+
+    if url_hits & URL_BONUS_KEYWORDS:
+        score += 0.1
+
+    return max(0.0, min(1.0, score))
+
+
+def score_link_batch(texts, urls):
+    """
+    Score every (anchor text, URL) pair from a page in one regex sweep.
+
+    The lowered texts and URLs are joined into a single NUL-separated blob and
+    scanned once per pattern; matches are attributed back to their link (and
+    to the text vs URL half) by bisecting on segment offsets. Returns a
+    float32 array of clamped relevancy scores.
+    """
+    count = len(urls)
+    scores = np.zeros(count, dtype=np.float32)
+    if count == 0:
+        return scores
+
+    segments = []    # lowered text/url segments, interleaved
+    boundaries = []  # running end offset of each segment within the blob
+    offset = 0
+    for text, url in zip(texts, urls):
+        for segment in ((text or '').lower(), url.lower()):
+            segments.append(segment)
+            offset += len(segment) + 1  # +1 for the NUL separator
+            boundaries.append(offset)
+    blob = '\x00'.join(segments)
+
+    # Deduplicate (link, segment-kind, keyword) so each keyword contributes
+    # once per string, matching the scalar scorer's presence semantics
+    seen = set()
+    url_hits = [set() for _ in range(count)]
+
+    for match in KEYWORD_RE.finditer(blob):
+        segment_index = bisect_right(boundaries, match.start())
+        link_index, in_url = divmod(segment_index, 2)
+        keyword = match.group(0)
+        key = (link_index, in_url, keyword)
+        if key in seen:
+            continue
+        seen.add(key)
+        if in_url:
+            scores[link_index] += URL_KEYWORD_WEIGHTS[keyword]
+            url_hits[link_index].add(keyword)
+        else:
+            scores[link_index] += TEXT_KEYWORD_WEIGHTS[keyword]
+
+    # Bonus for specific streaming indicators in the URL
+    for link_index, hits in enumerate(url_hits):
+        if hits & URL_BONUS_KEYWORDS:
+            scores[link_index] += 0.1
+
+    # Penalty for non-streaming content, once per distinct indicator per
+    # link; two or more distinct indicators zero the link outright, matching
+    # the scalar scorer's short-circuit
+    negative_hits = [set() for _ in range(count)]
+    for match in NEGATIVE_RE.finditer(blob):
+        link_index = bisect_right(boundaries, match.start()) // 2
+        negative_hits[link_index].add(match.group(0))
+    for link_index, hits in enumerate(negative_hits):
+        if len(hits) >= 2:
+            scores[link_index] = 0.0
+        elif hits:
+            scores[link_index] -= 0.5
+
+    return np.clip(scores, 0.0, 1.0)
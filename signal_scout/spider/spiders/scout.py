@@ -15,14 +15,20 @@ Spider name: 'scout' - run with: scrapy crawl scout
 
 import scrapy
 import logging
+import hashlib
 import re
 import json
 import os
-from urllib.parse import urljoin, urlparse
+import numpy as np
+from collections import OrderedDict
+from scrapy.linkextractors import LinkExtractor
 from googlesearch import search
 import sys
+import threading
 import time
 import sqlite3
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Add parent directory to path to import scout modules
@@ -31,10 +37,75 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from classifier import StreamingSiteClassifier
 from verification import verify_url
 from llm_analyst import LLMAnalyst
+from relevancy import calculate_relevancy_score, score_link_batch
 
 # Configure professional logging
 logger = logging.getLogger(__name__)
 
+# Single-pass host extraction; much lighter than a full urlparse for the
+# scheme://host URL shapes the crawler deals with.
+_URL_HOST_RE = re.compile(r'^(?:[a-z][a-z0-9+\-.]*:)?//([^/?#]*)', re.I)
+_HOST_PREFIX_RE = re.compile(r'^(?:www|m|mobile)\.')
+
+# Bound on the per-run classifier/LLM result caches (entries, LRU eviction)
+_RESULT_CACHE_SIZE = 4096
+
+# LLM prompts are token-capped downstream, so only this much of the decoded
+# body is carried through the verification queue
+_LLM_CONTENT_MAX_CHARS = 32768
+
+
+# Major platforms that won't host streaming content; seed hosts matching
+# these domains (or any of their subdomains) are rejected
+_SKIP_DOMAINS = frozenset({
+    'google.com', 'bing.com', 'yahoo.com', 'duckduckgo.com',
+    'facebook.com', 'twitter.com', 'youtube.com', 'instagram.com',
+    'reddit.com', 'wikipedia.org', 'amazon.com', 'ebay.com',
+})
+_SKIP_DOMAIN_SUFFIXES = tuple('.' + domain for domain in _SKIP_DOMAINS)
+
+
+# Indices into the spider's stats counter array; the paired labels drive
+# the final metrics report in closed()
+(
+    STAT_PAGES_CRAWLED,
+    STAT_LINKS_EVALUATED,
+    STAT_AI_POSITIVE,
+    STAT_AI_NEGATIVE,
+    STAT_V2_ATTEMPTED,
+    STAT_V2_PASSED,
+    STAT_URLS_WRITTEN,
+    STAT_SEEDS_ADDED,
+    STAT_LLM_ATTEMPTED,
+    STAT_LLM_SUCCESSFUL,
+    STAT_LLM_VERIFIED,
+) = range(11)
+
+_STAT_LABELS = (
+    'Pages Crawled',
+    'Links Evaluated',
+    'AI Classifications Positive',
+    'AI Classifications Negative',
+    'V2 Verifications Attempted',
+    'V2 Verifications Passed',
+    'URLs Written to Database',
+    'Autonomous Seeds Added',
+    'V4 LLM Analyses Attempted',
+    'V4 LLM Analyses Successful',
+    'LLM Verified Streaming Sites',
+)
+
+
+def _url_fingerprint(url):
+    """
+    16-byte digest used for the URL dedup sets.
+
+    Storing fixed-size digests instead of full URL strings keeps the
+    processed/discovered sets several times smaller over a long crawl and
+    makes each membership test hash a constant 16 bytes.
+    """
+    return hashlib.blake2b(url.encode('utf-8', 'ignore'), digest_size=16).digest()
+
 
 class ScoutSpider(scrapy.Spider):
     """
@@ -59,6 +130,17 @@ class ScoutSpider(scrapy.Spider):
         # Load configuration
         self.config = self._load_config()
         logger.info("Scout configuration loaded successfully")
+
+        # Resolve hot-path settings once; parse and the link loop read these
+        # attributes instead of repeating chained config.get lookups per page
+        v3_settings = self.config.get('v3_crawler_settings', {})
+        self.ai_threshold = float(v3_settings.get('ai_confidence_threshold', 0.7))
+        self.max_depth = int(v3_settings.get('max_crawl_depth', 3))
+        self.relevancy_threshold = float(v3_settings.get('relevancy_threshold', 0.6))
+        self.enable_autonomous_feedback = bool(v3_settings.get('enable_autonomous_feedback', True))
+        self.v2_threshold = float(
+            self.config.get('discovery_settings', {}).get('verification_confidence_threshold', 50)
+        )
         
         # Initialize AI classifier
         try:
@@ -79,33 +161,73 @@ class ScoutSpider(scrapy.Spider):
             logger.error(f"Failed to initialize V4 LLM Analyst: {e}")
             self.llm_analyst = None
         
-        # Initialize Scout instance for V2 verification pipeline
-        self.scout_instance = None
+        # Scout instances for the V2 verification pipeline: the sync
+        # Playwright API is bound to the thread that created it, so each
+        # verification worker lazily builds its own instance (thread-local)
+        # rather than sharing one browser across the pool
+        self._scout_tls = threading.local()
+        self._scout_instances = []
+        self._scout_instances_lock = threading.Lock()
+
+        # Worker pool so the V2 verification + LLM stages (both network-bound)
+        # run off the reactor thread instead of stalling parse callbacks.
+        # Threads rather than processes: the stages block on network I/O, and
+        # the SignalScout browser handle cannot cross a process boundary.
+        max_workers = int(v3_settings.get('max_verification_workers', 4))
+        self._max_verification_workers = max_workers
+        self.verification_pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='v2-verify'
+        )
+        logger.info(f"Verification pool sized at {max_workers} workers")
+
+        # One lxml-backed DOM pass per page for link extraction; negative
+        # indicators are left to the relevancy scorer, which penalizes them
+        # (-0.5 each) rather than hard-excluding a link that strong positive
+        # signals could still outscore
+        self.link_extractor = LinkExtractor(unique=True)
         
         # Initialize database connection for V3 integration
         self.db_path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'shared_data', 'sites.db')
         self.db_path = os.path.abspath(self.db_path)
         logger.info(f"Database path configured: {self.db_path}")
+
+        # One long-lived connection shared by the writer threads via a lock;
+        # WAL mode keeps Sideline app readers unblocked during crawl writes
+        # and the remaining PRAGMAs trade durability-on-power-loss for far
+        # fewer fsyncs on this rebuildable discovery data
+        self._db_lock = threading.Lock()
+        try:
+            self._db_conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            cursor = self._db_conn.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA cache_size=-64000")
+            cursor.execute("PRAGMA mmap_size=268435456")
+            cursor.execute("PRAGMA wal_autocheckpoint=1000")
+            logger.info("Database connection established (WAL journal mode)")
+        except Exception as e:
+            logger.error(f"Failed to open database connection: {e}")
+            self._db_conn = None
         
-        # Operational statistics tracking
-        self.stats = {
-            'run_start_time': datetime.now(),
-            'pages_crawled': 0,
-            'links_evaluated': 0,
-            'ai_classifications_positive': 0,
-            'ai_classifications_negative': 0,
-            'v2_verifications_attempted': 0,
-            'v2_verifications_passed': 0,
-            'urls_written_to_database': 0,
-            'autonomous_seeds_added': 0,
-            'llm_analyses_attempted': 0,
-            'llm_analyses_successful': 0,
-            'llm_verified_streaming_sites': 0
-        }
+        # Operational statistics tracking: a flat array of machine-word
+        # counters indexed by the STAT_* constants — increments are plain
+        # C-level item writes with no per-event dict hashing
+        self.run_start_time = datetime.now()
+        self.stats = array('q', [0] * len(_STAT_LABELS))
         
-        # Track processed URLs to avoid duplicates
+        # Track processed URLs to avoid duplicates; both sets hold 16-byte
+        # fingerprints (see _url_fingerprint) rather than full URL strings
         self.processed_urls = set()
         self.discovered_urls = set()
+
+        # Bounded LRU caches keyed by page-body hash so duplicate/templated
+        # pages skip the classifier forward pass and the LLM round-trip.
+        # The classification cache is only touched from the reactor thread;
+        # the LLM cache is shared by pool workers and needs its lock.
+        self._classification_cache = OrderedDict()
+        self._llm_cache = OrderedDict()
+        self._llm_cache_lock = threading.Lock()
         
         # Autonomous feedback queue
         self.feedback_queue = []
@@ -183,9 +305,10 @@ class ScoutSpider(scrapy.Spider):
         
         # Create initial requests with logging
         for url in demo_urls:
-            if url not in self.processed_urls:
-                self.processed_urls.add(url)
-                self.discovered_urls.add(url)
+            fingerprint = _url_fingerprint(url)
+            if fingerprint not in self.processed_urls:
+                self.processed_urls.add(fingerprint)
+                self.discovered_urls.add(fingerprint)
                 
                 logger.info(f"Creating initial request for seed URL: {url}")
                 yield scrapy.Request(
@@ -198,22 +321,16 @@ class ScoutSpider(scrapy.Spider):
     def _is_valid_seed_url(self, url):
         """Validate seed URLs against known filters."""
         try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            
-            # Skip major platforms that won't have streaming content
-            skip_domains = [
-                'google.com', 'bing.com', 'yahoo.com', 'duckduckgo.com',
-                'facebook.com', 'twitter.com', 'youtube.com', 'instagram.com',
-                'reddit.com', 'wikipedia.org', 'amazon.com', 'ebay.com'
-            ]
-            
-            for skip_domain in skip_domains:
-                if skip_domain in domain:
-                    return False
-            
-            return True
-            
+            match = _URL_HOST_RE.match(url)
+            if not match:
+                return False
+            host = match.group(1).lower().rstrip('.')
+
+            # Suffix match covers the domain and its subdomains in one
+            # endswith call, without the false positives of substring search
+            # (e.g. "notgoogle.com.example" no longer matches)
+            return not (host in _SKIP_DOMAINS or host.endswith(_SKIP_DOMAIN_SUFFIXES))
+
         except Exception:
             return False
     
@@ -225,7 +342,7 @@ class ScoutSpider(scrapy.Spider):
         current_depth = response.meta.get('depth', 0)
         source = response.meta.get('source', 'crawl')
         
-        self.stats['pages_crawled'] += 1
+        self.stats[STAT_PAGES_CRAWLED] += 1
         
         logger.info(f"New page being crawled: {url} (depth: {current_depth}, source: {source})")
         
@@ -234,8 +351,19 @@ class ScoutSpider(scrapy.Spider):
             logger.info(f"Crawled page being passed to AI Classifier: {url}")
             
             try:
-                classification_result = self.classifier.classify_page(response.text, url)
-                
+                # Decode the body exactly once and reuse the same string for
+                # classification and the downstream verification/LLM stages
+                page_text = response.text
+                content_hash = hashlib.blake2b(response.body, digest_size=16).digest()
+                classification_result = self._classification_cache.get(content_hash)
+
+                if classification_result is not None:
+                    self._classification_cache.move_to_end(content_hash)
+                    logger.info(f"Classifier cache hit for {url} (duplicate page body)")
+                else:
+                    classification_result = self.classifier.classify_page(page_text, url)
+                    self._cache_store(self._classification_cache, content_hash, classification_result)
+
                 ai_probability = classification_result.get('probability', 0)
                 is_streaming_candidate = classification_result.get('is_streaming_site', False)
                 
@@ -243,16 +371,18 @@ class ScoutSpider(scrapy.Spider):
                            f"({'POSITIVE' if is_streaming_candidate else 'NEGATIVE'})")
                 
                 if is_streaming_candidate:
-                    self.stats['ai_classifications_positive'] += 1
+                    self.stats[STAT_AI_POSITIVE] += 1
                 else:
-                    self.stats['ai_classifications_negative'] += 1
+                    self.stats[STAT_AI_NEGATIVE] += 1
                 
                 # High-confidence sites go to V2 verification pipeline
-                ai_threshold = self.config.get('v3_crawler_settings', {}).get('ai_confidence_threshold', 0.7)
-                
-                if ai_probability >= ai_threshold:
+                if ai_probability >= self.ai_threshold:
                     logger.info(f"URL passing to final V2 verification pipeline: {url} (AI confidence: {ai_probability:.3f})")
-                    self._verify_with_v2_pipeline(url, classification_result, response.text)
+                    self.verification_pool.submit(
+                        self._verify_with_v2_pipeline,
+                        url, classification_result,
+                        page_text[:_LLM_CONTENT_MAX_CHARS], content_hash
+                    )
                 else:
                     logger.debug(f"URL filtered out by AI classifier: {url} (confidence: {ai_probability:.3f})")
                     
@@ -262,50 +392,106 @@ class ScoutSpider(scrapy.Spider):
             logger.warning(f"AI Classifier not available, skipping classification for: {url}")
         
         # Focused Crawling: Extract and evaluate links
-        max_depth = self.config.get('v3_crawler_settings', {}).get('max_crawl_depth', 3)
-        
-        if current_depth < max_depth:
+        if current_depth < self.max_depth:
             for next_request in self._extract_and_evaluate_links(response, current_depth):
                 yield next_request
         
         # Log periodic statistics
-        if self.stats['pages_crawled'] % 10 == 0:
+        if self.stats[STAT_PAGES_CRAWLED] % 10 == 0:
             self._log_operational_statistics()
     
-    def _verify_with_v2_pipeline(self, url, classification_result, page_content=""):
+    def _cache_store(self, cache, key, value):
+        """Insert into a bounded LRU result cache, evicting the oldest entry."""
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > _RESULT_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _get_scout_instance(self):
+        """
+        Return this worker thread's SignalScout, creating it on first use.
+
+        Sync Playwright refuses calls from any thread other than its
+        creator, so sharing one instance across the pool would break dynamic
+        rendering on every worker but one; each thread owns its own browser
+        instead, and all instances are tracked for cleanup at spider close.
+        """
+        scout = getattr(self._scout_tls, 'scout', None)
+        if scout is None:
+            from scout import SignalScout
+            scout = SignalScout()
+            self._scout_tls.scout = scout
+            with self._scout_instances_lock:
+                self._scout_instances.append(scout)
+            logger.info("V2 Scout instance initialized for verification worker "
+                        f"{threading.current_thread().name}")
+        return scout
+
+    def _cleanup_worker_scout(self, barrier):
+        """
+        Close this worker thread's SignalScout, if it ever created one.
+
+        Runs on the verification pool itself because sync Playwright objects
+        can only be closed from the thread that created them. The barrier
+        parks every worker until each holds exactly one cleanup task, so an
+        idle worker cannot drain two tasks and leave another thread's
+        browser unclosed.
+        """
+        try:
+            barrier.wait(timeout=60)
+        except threading.BrokenBarrierError:
+            pass
+        scout = getattr(self._scout_tls, 'scout', None)
+        if scout is None:
+            return
+        self._scout_tls.scout = None
+        try:
+            scout._cleanup_browser()
+            logger.info("V2 Scout cleaned up on worker "
+                        f"{threading.current_thread().name}")
+        except Exception as e:
+            logger.debug(f"Error during scout cleanup: {e}")
+
+    def _verify_with_v2_pipeline(self, url, classification_result, page_content="", content_hash=None):
         """
         Send high-confidence AI classifications through V2 verification pipeline
         and V4 LLM cognitive analysis.
         """
         try:
-            self.stats['v2_verifications_attempted'] += 1
-            
-            # Initialize scout instance for V2 verification if needed
-            if not self.scout_instance:
-                from scout import SignalScout
-                self.scout_instance = SignalScout()
-                logger.info("V2 Scout instance initialized for verification pipeline")
-            
-            # Run V2 verification
+            self.stats[STAT_V2_ATTEMPTED] += 1
+
+            # Run V2 verification with this worker thread's own scout
             logger.info(f"Running V2 verification for: {url}")
-            verification_result = verify_url(url, scout_instance=self.scout_instance)
+            verification_result = verify_url(url, scout_instance=self._get_scout_instance())
             
             # Check V2 verification threshold
-            v2_threshold = self.config.get('discovery_settings', {}).get('verification_confidence_threshold', 50)
+            v2_threshold = self.v2_threshold
             v2_confidence = verification_result['overall_confidence']
             
             if v2_confidence >= v2_threshold:
                 logger.info(f"URL passing final V2 verification pipeline: {url} (V2 confidence: {v2_confidence})")
-                self.stats['v2_verifications_passed'] += 1
-                
-                # V4 LLM Cognitive Analysis Stage
-                llm_analysis_result = self._perform_llm_analysis(url, page_content)
-                
-                # Store in database with LLM enrichment
-                self._write_url_to_database(url, verification_result, llm_analysis_result)
+                self.stats[STAT_V2_PASSED] += 1
                 
+                # V4 LLM Cognitive Analysis Stage: dispatched back onto the
+                # pool so this verify worker frees up as soon as V2 finishes;
+                # the database write runs when the LLM future resolves
+                try:
+                    llm_future = self.verification_pool.submit(
+                        self._perform_llm_analysis, url, page_content, content_hash
+                    )
+                    llm_future.add_done_callback(
+                        lambda future, url=url, result=verification_result:
+                            self._finalize_verified_site(url, result, future)
+                    )
+                except RuntimeError:
+                    # Pool is shutting down (spider close): finish inline on
+                    # this worker so the verified site is still written
+                    logger.info(f"Verification pool closing; finishing {url} inline")
+                    llm_result = self._perform_llm_analysis(url, page_content, content_hash)
+                    self._write_url_to_database(url, verification_result, llm_result)
+
                 # Autonomous feedback loop
-                if self.config.get('v3_crawler_settings', {}).get('enable_autonomous_feedback', True):
+                if self.enable_autonomous_feedback:
                     self._add_to_autonomous_feedback(url)
                 
             else:
@@ -313,8 +499,21 @@ class ScoutSpider(scrapy.Spider):
                 
         except Exception as e:
             logger.error(f"V2 verification pipeline failed for {url}: {e}")
-    
-    def _perform_llm_analysis(self, url, page_content):
+
+    def _finalize_verified_site(self, url, verification_result, llm_future):
+        """Complete a verified site once its deferred LLM analysis resolves."""
+        try:
+            llm_analysis_result = llm_future.result()
+        except Exception as e:
+            logger.error(f"Deferred LLM analysis failed for {url}: {e}")
+            llm_analysis_result = None
+
+        try:
+            self._write_url_to_database(url, verification_result, llm_analysis_result)
+        except Exception as e:
+            logger.error(f"Deferred database write failed for {url}: {e}")
+
+    def _perform_llm_analysis(self, url, page_content, content_hash=None):
         """
         V6.0 COGNITIVE ANALYSIS ENGINE
         
@@ -336,19 +535,33 @@ class ScoutSpider(scrapy.Spider):
                 "error": "LLM Analyst not initialized"
             }
         
+        # Reuse prior analyses of identical page bodies on the same host so
+        # templated/mirrored pages cost only a hash and a cache lookup
+        cache_key = None
+        if content_hash is not None:
+            host_match = _URL_HOST_RE.match(url)
+            cache_key = (content_hash, host_match.group(1).lower() if host_match else url)
+            with self._llm_cache_lock:
+                cached_result = self._llm_cache.get(cache_key)
+                if cached_result is not None:
+                    self._llm_cache.move_to_end(cache_key)
+            if cached_result is not None:
+                logger.info(f"LLM analysis cache hit for {url} (duplicate page body)")
+                return cached_result
+
         try:
-            self.stats['llm_analyses_attempted'] += 1
-            
+            self.stats[STAT_LLM_ATTEMPTED] += 1
+
             logger.info(f"V6.0 COGNITIVE ANALYSIS ENGINE STARTING for: {url}")
-            
+
             # Get V6.0 cognitive analysis with structured reasoning from LLM
             llm_result = self.llm_analyst.get_cognitive_analysis(page_content, url)
             
             if 'error' not in llm_result:
-                self.stats['llm_analyses_successful'] += 1
+                self.stats[STAT_LLM_SUCCESSFUL] += 1
                 
                 if llm_result.get('is_sports_streaming_site', False):
-                    self.stats['llm_verified_streaming_sites'] += 1
+                    self.stats[STAT_LLM_VERIFIED] += 1
                     logger.info(f"V6.0 COGNITIVE VERIFICATION SUCCESS: {url} verified as streaming site - "
                                f"Service: {llm_result.get('service_name')} "
                                f"Confidence: {llm_result.get('final_confidence_score')}")
@@ -365,7 +578,11 @@ class ScoutSpider(scrapy.Spider):
                                f"Confidence: {llm_result.get('final_confidence_score')}")
             else:
                 logger.warning(f"V6.0 Cognitive Analysis had errors for {url}: {llm_result.get('error')}")
-            
+
+            if cache_key is not None and 'error' not in llm_result:
+                with self._llm_cache_lock:
+                    self._cache_store(self._llm_cache, cache_key, llm_result)
+
             return llm_result
             
         except Exception as e:
@@ -390,10 +607,11 @@ class ScoutSpider(scrapy.Spider):
         Write successfully verified URL to database with full cognitive reasoning audit trail.
         Stores the complete Chain-of-Thought process for transparent AI decision tracking.
         """
+        if not self._db_conn:
+            logger.error(f"No database connection available, dropping write for {url}")
+            return
+
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
             # Extract site name from V6.0 LLM result or fallback to URL parsing
             if llm_analysis_result and llm_analysis_result.get('service_name') != 'Unknown':
                 site_name = llm_analysis_result['service_name']
@@ -401,7 +619,9 @@ class ScoutSpider(scrapy.Spider):
                 site_name = self._extract_site_name(url)
             
             confidence_score = verification_result.get('overall_confidence', 0)
-            timestamp = datetime.now()
+            # Bind a preformatted string: sqlite3 stores TEXT either way, and
+            # formatting once here skips the per-bind datetime adapter
+            timestamp = datetime.now().isoformat(sep=' ', timespec='seconds')
             
             # Extract V6.0 LLM cognitive data
             llm_verified = None
@@ -414,33 +634,36 @@ class ScoutSpider(scrapy.Spider):
                 if reasoning_process:
                     llm_full_reasoning = json.dumps(reasoning_process, ensure_ascii=False)
             
-            # Check if URL already exists
-            cursor.execute("SELECT id FROM sites WHERE url = ?", (url,))
-            existing = cursor.fetchone()
-            
-            if existing:
-                # Update existing entry with V6.0 cognitive reasoning
-                cursor.execute("""
-                    UPDATE sites 
-                    SET last_verified = ?, confidence_score = ?, is_active = 1, status = 'active',
-                        name = ?, llm_full_reasoning = ?
-                    WHERE url = ?
-                """, (timestamp, confidence_score, site_name, llm_full_reasoning, url))
-                logger.info(f"V6.0 URL successfully updated in database with cognitive reasoning: {url}")
-            else:
-                # Insert new entry with V6.0 cognitive reasoning
-                cursor.execute("""
-                    INSERT INTO sites (name, url, source, last_verified, confidence_score, is_active, status, 
-                                     llm_full_reasoning)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (site_name, url, 'v6_cognitive_discovery', timestamp, confidence_score, 1, 'active',
-                      llm_full_reasoning))
-                logger.info(f"V6.0 URL successfully written to database with cognitive reasoning: {url}")
-            
-            conn.commit()
-            conn.close()
-            
-            self.stats['urls_written_to_database'] += 1
+            # Writers share the long-lived connection, serialized by the lock
+            with self._db_lock:
+                cursor = self._db_conn.cursor()
+
+                # Check if URL already exists
+                cursor.execute("SELECT id FROM sites WHERE url = ?", (url,))
+                existing = cursor.fetchone()
+
+                if existing:
+                    # Update existing entry with V6.0 cognitive reasoning
+                    cursor.execute("""
+                        UPDATE sites
+                        SET last_verified = ?, confidence_score = ?, is_active = 1, status = 'active',
+                            name = ?, llm_full_reasoning = ?
+                        WHERE url = ?
+                    """, (timestamp, confidence_score, site_name, llm_full_reasoning, url))
+                    logger.info(f"V6.0 URL successfully updated in database with cognitive reasoning: {url}")
+                else:
+                    # Insert new entry with V6.0 cognitive reasoning
+                    cursor.execute("""
+                        INSERT INTO sites (name, url, source, last_verified, confidence_score, is_active, status,
+                                         llm_full_reasoning)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """, (site_name, url, 'v6_cognitive_discovery', timestamp, confidence_score, 1, 'active',
+                          llm_full_reasoning))
+                    logger.info(f"V6.0 URL successfully written to database with cognitive reasoning: {url}")
+
+                self._db_conn.commit()
+
+            self.stats[STAT_URLS_WRITTEN] += 1
             
             # Log the V6.0 cognitive enrichment details
             if llm_analysis_result and 'error' not in llm_analysis_result:
@@ -457,22 +680,15 @@ class ScoutSpider(scrapy.Spider):
     def _extract_site_name(self, url):
         """Extract a clean site name from URL."""
         try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            
+            match = _URL_HOST_RE.match(url)
+            domain = (match.group(1) if match else url).lower()
+
             # Remove common prefixes
-            for prefix in ['www.', 'm.', 'mobile.']:
-                if domain.startswith(prefix):
-                    domain = domain[len(prefix):]
-                    break
-            
+            domain = _HOST_PREFIX_RE.sub('', domain, count=1)
+
             # Take the main domain name
-            parts = domain.split('.')
-            if len(parts) >= 2:
-                return parts[0].title()
-            else:
-                return domain.title()
-                
+            return domain.split('.', 1)[0].title() if domain else url
+
         except Exception:
             return url
     
@@ -480,105 +696,104 @@ class ScoutSpider(scrapy.Spider):
         """
         Add verified URL to autonomous feedback queue for continued crawling.
         """
-        if url not in self.feedback_queue and url not in self.processed_urls:
+        if url not in self.feedback_queue and _url_fingerprint(url) not in self.processed_urls:
             self.feedback_queue.append(url)
-            self.stats['autonomous_seeds_added'] += 1
+            self.stats[STAT_SEEDS_ADDED] += 1
             logger.info(f"Autonomous feedback: Added verified site to crawl queue: {url}")
-    
+
+    def _flush_feedback_queue(self):
+        """
+        Persist the autonomous feedback queue in one batch transaction.
+
+        Seeds accumulate in memory during the run; a single executemany with
+        INSERT OR IGNORE commits them all at once, so the flush costs one
+        transaction regardless of queue length.
+        """
+        if not self.feedback_queue or not self._db_conn:
+            return
+
+        try:
+            discovered_at = datetime.now().isoformat(sep=' ', timespec='seconds')
+            with self._db_lock:
+                cursor = self._db_conn.cursor()
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS discovered_seeds (
+                        url TEXT PRIMARY KEY,
+                        source TEXT,
+                        discovered_at TEXT
+                    )
+                """)
+                cursor.executemany(
+                    "INSERT OR IGNORE INTO discovered_seeds (url, source, discovered_at) VALUES (?, ?, ?)",
+                    [(url, 'autonomous_feedback', discovered_at) for url in self.feedback_queue]
+                )
+                self._db_conn.commit()
+            logger.info(f"Flushed {len(self.feedback_queue)} autonomous feedback seeds to database")
+        except Exception as e:
+            logger.error(f"Failed to flush feedback queue: {e}")
+
+
     def _extract_and_evaluate_links(self, response, current_depth):
         """
         Extract links and evaluate them with relevancy scoring.
+
+        Link extraction goes through Scrapy's LinkExtractor — one lxml pass
+        with URL resolution and dedup handled in C — and the selected links
+        are batch-yielded via response.follow_all.
         """
-        links_found = response.css('a::attr(href)').getall()
-        logger.debug(f"Found {len(links_found)} links on page: {response.url}")
-        
-        scored_links = []
-        
-        for link in links_found:
-            try:
-                # Resolve relative URLs
-                full_url = urljoin(response.url, link)
-                
-                # Skip if already processed
-                if full_url in self.processed_urls:
-                    continue
-                
-                # Calculate relevancy score
-                relevancy_score = self._calculate_relevancy_score(link, full_url)
-                
-                self.stats['links_evaluated'] += 1
-                logger.debug(f"Link being evaluated: {full_url} -> relevancy score: {relevancy_score:.2f}")
-                
-                # Check relevancy threshold
-                relevancy_threshold = self.config.get('v3_crawler_settings', {}).get('relevancy_threshold', 0.6)
-                
-                if relevancy_score >= relevancy_threshold:
-                    scored_links.append((full_url, relevancy_score))
-                    logger.debug(f"Link passed relevancy threshold: {full_url} (score: {relevancy_score:.2f})")
-                
-            except Exception as e:
-                logger.debug(f"Error processing link {link}: {e}")
-        
-        # Sort by relevancy score and limit
-        scored_links.sort(key=lambda x: x[1], reverse=True)
-        
+        try:
+            links = self.link_extractor.extract_links(response)
+        except Exception as e:
+            logger.debug(f"Link extraction failed for {response.url}: {e}")
+            return
+
+        logger.debug(f"Found {len(links)} links on page: {response.url}")
+
+        relevancy_threshold = self.relevancy_threshold
         max_links = 10  # Limit for focused crawling
-        
-        for url, score in scored_links[:max_links]:
-            if url not in self.processed_urls:
-                self.processed_urls.add(url)
-                
-                logger.info(f"Link being evaluated: {url} and calculated relevancy score: {score:.2f}")
-                
-                yield scrapy.Request(
-                    url=url,
-                    callback=self.parse,
-                    meta={'depth': current_depth + 1, 'source': 'focused_crawl'},
-                    errback=self.handle_error
-                )
+
+        candidates = [
+            (link.text, link.url) for link in links
+            if _url_fingerprint(link.url) not in self.processed_urls
+        ]
+
+        if not candidates:
+            return
+
+        # Score the whole page's links in one batch pass
+        scores = score_link_batch([c[0] for c in candidates], [c[1] for c in candidates])
+        self.stats[STAT_LINKS_EVALUATED] += len(candidates)
+
+        # Partial top-K selection over the passing links, highest scores first
+        passing = np.flatnonzero(scores >= relevancy_threshold)
+        if passing.size > max_links:
+            passing = passing[np.argpartition(scores[passing], -max_links)[-max_links:]]
+        selected = passing[np.argsort(scores[passing])[::-1]]
+
+        selected_urls = []
+        for index in selected:
+            url = candidates[index][1]
+            fingerprint = _url_fingerprint(url)
+            if fingerprint not in self.processed_urls:
+                self.processed_urls.add(fingerprint)
+                logger.info(f"Link being evaluated: {url} and calculated relevancy score: "
+                            f"{float(scores[index]):.2f}")
+                selected_urls.append(url)
+
+        yield from response.follow_all(
+            urls=selected_urls,
+            callback=self.parse,
+            meta={'depth': current_depth + 1, 'source': 'focused_crawl'},
+            errback=self.handle_error
+        )
     
     def _calculate_relevancy_score(self, link_text, url):
         """
         Calculate relevancy score based on sports/streaming indicators.
+
+        Delegates to the shared single-pass scorer in relevancy.py.
         """
-        score = 0.0
-        
-        # Keyword scoring
-        streaming_keywords = ['live', 'stream', 'watch', 'tv', 'video', 'player', 'free']
-        sports_keywords = ['nfl', 'nba', 'nhl', 'mlb', 'soccer', 'football', 'basketball', 'sports']
-        
-        text_lower = link_text.lower() if link_text else ""
-        url_lower = url.lower()
-        
-        # Anchor text scoring
-        for keyword in streaming_keywords:
-            if keyword in text_lower:
-                score += 0.3
-        
-        for keyword in sports_keywords:
-            if keyword in text_lower:
-                score += 0.2
-        
-        # URL scoring
-        for keyword in streaming_keywords:
-            if keyword in url_lower:
-                score += 0.2
-        
-        for keyword in sports_keywords:
-            if keyword in url_lower:
-                score += 0.15
-        
-        # Bonus for specific indicators
-        if any(indicator in url_lower for indicator in ['live', 'stream', 'watch']):
-            score += 0.1
-        
-        # Penalty for non-streaming content
-        negative_indicators = ['privacy', 'terms', 'contact', 'about', 'dmca', 'legal', 'cookie']
-        for indicator in negative_indicators:
-            if indicator in url_lower or indicator in text_lower:
-                score -= 0.5
-        
-        return max(0.0, min(1.0, score))  # Clamp between 0 and 1
+        return calculate_relevancy_score(link_text, url)
     
     def handle_error(self, failure):
         """Handle request errors with logging."""
@@ -586,56 +801,72 @@ class ScoutSpider(scrapy.Spider):
     
     def _log_operational_statistics(self):
         """Log comprehensive operational statistics."""
-        runtime = datetime.now() - self.stats['run_start_time']
+        runtime = datetime.now() - self.run_start_time
         
         logger.info("="*50)
         logger.info("SCOUT OPERATIONAL STATISTICS")
         logger.info(f"Runtime: {runtime}")
-        logger.info(f"Pages Crawled: {self.stats['pages_crawled']}")
-        logger.info(f"Links Evaluated: {self.stats['links_evaluated']}")
-        logger.info(f"AI Classifications: +{self.stats['ai_classifications_positive']} -{self.stats['ai_classifications_negative']}")
-        logger.info(f"V2 Verifications: {self.stats['v2_verifications_attempted']} attempted, {self.stats['v2_verifications_passed']} passed")
-        logger.info(f"V4 LLM Analyses: {self.stats['llm_analyses_attempted']} attempted, {self.stats['llm_analyses_successful']} successful")
-        logger.info(f"LLM Verified Streaming Sites: {self.stats['llm_verified_streaming_sites']}")
-        logger.info(f"URLs Written to Database: {self.stats['urls_written_to_database']}")
-        logger.info(f"Autonomous Seeds Added: {self.stats['autonomous_seeds_added']}")
+        logger.info(f"Pages Crawled: {self.stats[STAT_PAGES_CRAWLED]}")
+        logger.info(f"Links Evaluated: {self.stats[STAT_LINKS_EVALUATED]}")
+        logger.info(f"AI Classifications: +{self.stats[STAT_AI_POSITIVE]} -{self.stats[STAT_AI_NEGATIVE]}")
+        logger.info(f"V2 Verifications: {self.stats[STAT_V2_ATTEMPTED]} attempted, {self.stats[STAT_V2_PASSED]} passed")
+        logger.info(f"V4 LLM Analyses: {self.stats[STAT_LLM_ATTEMPTED]} attempted, {self.stats[STAT_LLM_SUCCESSFUL]} successful")
+        logger.info(f"LLM Verified Streaming Sites: {self.stats[STAT_LLM_VERIFIED]}")
+        logger.info(f"URLs Written to Database: {self.stats[STAT_URLS_WRITTEN]}")
+        logger.info(f"Autonomous Seeds Added: {self.stats[STAT_SEEDS_ADDED]}")
         logger.info("="*50)
     
     def closed(self, reason):
         """
         Called when spider closes with final statistics and cleanup.
         """
+        # Each worker closes its own thread-local scout on the pool before
+        # it shuts down: sync Playwright objects are bound to their creating
+        # thread, so the reactor thread cannot close them. The cleanup tasks
+        # queue behind any in-flight verification/LLM work, so that drains
+        # first; workers with no scout just pass through the barrier.
+        cleanup_barrier = threading.Barrier(self._max_verification_workers)
+        cleanup_futures = [
+            self.verification_pool.submit(self._cleanup_worker_scout, cleanup_barrier)
+            for _ in range(self._max_verification_workers)
+        ]
+        for future in cleanup_futures:
+            try:
+                future.result()
+            except Exception as e:
+                logger.debug(f"Scout cleanup task failed: {e}")
+        if self._scout_instances:
+            logger.info(f"V2 Scout instance cleanup completed "
+                        f"({len(self._scout_instances)} instances)")
+
+        # Let any remaining pool work finish before reporting stats
+        self.verification_pool.shutdown(wait=True)
+
+        # Persist queued feedback seeds in one batch write
+        self._flush_feedback_queue()
+
         end_time = datetime.now()
-        total_runtime = end_time - self.stats['run_start_time']
+        total_runtime = end_time - self.run_start_time
         
         logger.info("="*60)
         logger.info("SCOUT RUN ENDING - FINAL STATISTICS")
         logger.info("="*60)
         logger.info(f"Closure Reason: {reason}")
         logger.info(f"Total Runtime: {total_runtime}")
-        logger.info(f"Start Time: {self.stats['run_start_time']}")
+        logger.info(f"Start Time: {self.run_start_time}")
         logger.info(f"End Time: {end_time}")
         logger.info("")
         logger.info("FINAL OPERATIONAL METRICS:")
-        logger.info(f"  Pages Crawled: {self.stats['pages_crawled']}")
-        logger.info(f"  Links Evaluated: {self.stats['links_evaluated']}")
-        logger.info(f"  AI Classifications Positive: {self.stats['ai_classifications_positive']}")
-        logger.info(f"  AI Classifications Negative: {self.stats['ai_classifications_negative']}")
-        logger.info(f"  V2 Verifications Attempted: {self.stats['v2_verifications_attempted']}")
-        logger.info(f"  V2 Verifications Passed: {self.stats['v2_verifications_passed']}")
-        logger.info(f"  V4 LLM Analyses Attempted: {self.stats['llm_analyses_attempted']}")
-        logger.info(f"  V4 LLM Analyses Successful: {self.stats['llm_analyses_successful']}")
-        logger.info(f"  LLM Verified Streaming Sites: {self.stats['llm_verified_streaming_sites']}")
-        logger.info(f"  URLs Written to Database: {self.stats['urls_written_to_database']}")
-        logger.info(f"  Autonomous Seeds Added: {self.stats['autonomous_seeds_added']}")
+        for label, value in zip(_STAT_LABELS, self.stats):
+            logger.info(f"  {label}: {value}")
         logger.info("")
         logger.info("DISCOVERY CYCLE COMPLETE")
         logger.info("="*60)
         
-        # Clean up scout instance if created
-        if self.scout_instance:
+        # Close the shared database connection
+        if self._db_conn:
             try:
-                self.scout_instance._cleanup_browser()
-                logger.info("V2 Scout instance cleanup completed")
+                self._db_conn.close()
+                logger.info("Database connection closed")
             except Exception as e:
-                logger.debug(f"Error during scout cleanup: {e}")
\ No newline at end of file
+                logger.debug(f"Error closing database connection: {e}")
\ No newline at end of file
@@ -6,23 +6,48 @@ streaming sites using AI classification and intelligent link following.
 """
 
 import scrapy
+import heapq
 import logging
+import hashlib
 import re
 import json
+import numpy as np
 import os
-from urllib.parse import urljoin, urlparse
+from collections import OrderedDict
+from urllib.parse import urlparse
+from scrapy.linkextractors import LinkExtractor
 from googlesearch import search
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path to import scout modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from classifier import StreamingSiteClassifier
+from relevancy import calculate_relevancy_score, score_link_batch
 from verification import verify_url
 
 logger = logging.getLogger(__name__)
 
+# Bound on the per-run classification result cache (entries, LRU eviction)
+_CLASSIFY_CACHE_SIZE = 4096
+
+
+def _url_fingerprint(url):
+    """
+    64-bit integer digest used for the discovered-URL dedup set.
+
+    A set of plain ints is the cheapest dedup structure CPython offers —
+    ints hash to themselves, so membership tests skip string hashing
+    entirely and each entry costs a small fixed-size object instead of a
+    full URL string. Collision odds at crawler scale (~10^6 URLs against a
+    64-bit space) are negligible.
+    """
+    return int.from_bytes(
+        hashlib.blake2b(url.encode('utf-8', 'ignore'), digest_size=8).digest(),
+        'little',
+    )
+
 
 class StreamingSiteSpider(scrapy.Spider):
     """
@@ -38,16 +63,38 @@ class StreamingSiteSpider(scrapy.Spider):
     name = "streaming_spider"
     allowed_domains = []  # Will be populated dynamically
     start_urls = []
+
+    # One lxml pass per page with URL resolution, canonicalization and
+    # dedup handled at C-extension speed
+    LINK_EXTRACTOR = LinkExtractor(unique=True, canonicalize=True)
     
-    # Class-level variables for configuration
+    # Class-level variables for configuration, tuned for broad crawling:
+    # this spider fans out across many domains, so the throughput lever is
+    # total concurrency with AutoThrottle providing per-domain politeness
+    # instead of a fixed global delay
     custom_settings = {
         'ROBOTSTXT_OBEY': False,  # Many streaming sites block robots
-        'DOWNLOAD_DELAY': 1,
-        'CONCURRENT_REQUESTS': 5,
-        'CONCURRENT_REQUESTS_PER_DOMAIN': 2,
+        'DOWNLOAD_DELAY': 0,
+        'CONCURRENT_REQUESTS': 128,
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 4,
         'DEPTH_LIMIT': 3,
         'CLOSESPIDER_PAGECOUNT': 100,  # Limit for testing
         'USER_AGENT': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        'DOWNLOAD_TIMEOUT': 30,
+        # AutoThrottle backs off per-domain from observed latencies
+        'AUTOTHROTTLE_ENABLED': True,
+        'AUTOTHROTTLE_START_DELAY': 0.5,
+        'AUTOTHROTTLE_TARGET_CONCURRENCY': 8,
+        # Broad crawls resolve thousands of distinct hosts
+        'DNSCACHE_ENABLED': True,
+        'DNSCACHE_SIZE': 100000,
+        'DNS_TIMEOUT': 5,
+        'REACTOR_THREADPOOL_MAXSIZE': 40,
+        # Keep slow domains from starving the downloader queue
+        'SCHEDULER_PRIORITY_QUEUE': 'scrapy.pqueues.DownloaderAwarePriorityQueue',
+        # RFC2616 cache skips refetching unchanged pages across runs
+        'HTTPCACHE_ENABLED': True,
+        'HTTPCACHE_POLICY': 'scrapy.extensions.httpcache.RFC2616Policy',
         'DOWNLOADER_MIDDLEWARES': {
             'scrapy.downloadermiddlewares.retry.RetryMiddleware': 90,
             'scrapy.downloadermiddlewares.httpproxy.HttpProxyMiddleware': 110,
@@ -59,7 +106,18 @@ class StreamingSiteSpider(scrapy.Spider):
         
         # Load configuration
         self.config = self._load_config()
-        
+
+        # Resolve hot-path settings once; parse and the link loop read these
+        # attributes instead of repeating chained config.get lookups per page
+        v3_settings = self.config.get('v3_crawler_settings', {})
+        self.ai_threshold = float(v3_settings.get('ai_confidence_threshold', 0.7))
+        self.max_depth = int(v3_settings.get('max_crawl_depth', 3))
+        self.relevancy_threshold = float(v3_settings.get('relevancy_threshold', 0.6))
+        self.enable_autonomous_feedback = bool(v3_settings.get('enable_autonomous_feedback', True))
+        self.v2_threshold = float(
+            self.config.get('discovery_settings', {}).get('verification_confidence_threshold', 50)
+        )
+
         # Initialize AI classifier
         self.classifier = StreamingSiteClassifier()
         
@@ -76,8 +134,13 @@ class StreamingSiteSpider(scrapy.Spider):
             'new_seeds_added': 0
         }
         
-        # Track discovered URLs to avoid duplicates
+        # Track discovered URLs to avoid duplicates; holds integer
+        # fingerprints (see _url_fingerprint) rather than full URL strings
         self.discovered_urls = set()
+
+        # Bounded LRU cache keyed by page-body hash so duplicate/templated
+        # pages skip the classifier forward pass
+        self._classification_cache = OrderedDict()
         
         # Queue for autonomous feedback loop
         self.feedback_queue = []
@@ -110,30 +173,32 @@ class StreamingSiteSpider(scrapy.Spider):
             logger.warning("No seed queries configured, using default")
             seed_queries = ["watch sports online free", "live streaming sites"]
         
-        initial_urls = []
-        
-        for query in seed_queries:
+        def run_query(query):
             logger.info(f"Genesis Search: '{query}'")
             try:
                 # Use googlesearch to get initial seed URLs
-                search_results = list(search(query, num=5, stop=5, pause=2))
-                
+                return list(search(query, num=5, stop=5, pause=2))
+            except Exception as e:
+                logger.error(f"Search failed for query '{query}': {e}")
+                return []
+
+        # The searches are network-bound with long internal pauses; a small
+        # thread pool overlaps them instead of serializing spider startup
+        initial_urls = []
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for search_results in executor.map(run_query, seed_queries):
                 for url in search_results:
                     if self._is_valid_seed_url(url):
                         initial_urls.append(url)
                         logger.info(f"Genesis Seed: {url}")
-                
-                time.sleep(1)  # Rate limiting
-                
-            except Exception as e:
-                logger.error(f"Search failed for query '{query}': {e}")
         
         logger.info(f"Genesis Engine generated {len(initial_urls)} seed URLs")
         
         # Create initial requests
         for url in initial_urls:
-            if url not in self.discovered_urls:
-                self.discovered_urls.add(url)
+            fingerprint = _url_fingerprint(url)
+            if fingerprint not in self.discovered_urls:
+                self.discovered_urls.add(fingerprint)
                 yield scrapy.Request(
                     url=url,
                     callback=self.parse,
@@ -175,8 +240,21 @@ class StreamingSiteSpider(scrapy.Spider):
         
         logger.info(f"V3 Parse: {url} (depth: {current_depth}, source: {source})")
         
-        # AI Classification Phase
-        classification_result = self.classifier.classify_page(response.text, url)
+        # AI Classification Phase, memoized by page-body hash: templated
+        # sites serve near-identical pages and the classifier is the most
+        # expensive CPU step per page
+        content_hash = hashlib.blake2b(response.body, digest_size=16).digest()
+        classification_result = self._classification_cache.get(content_hash)
+        if classification_result is not None:
+            self._classification_cache.move_to_end(content_hash)
+            logger.debug(f"Classification cache hit for {url}")
+        else:
+            # Raw bytes: the classifier decodes once itself, so the response
+            # never needs Scrapy's decoded-text property on a cache miss
+            classification_result = self.classifier.classify_page(response.body, url)
+            self._classification_cache[content_hash] = classification_result
+            if len(self._classification_cache) > _CLASSIFY_CACHE_SIZE:
+                self._classification_cache.popitem(last=False)
         
         ai_probability = classification_result.get('probability', 0)
         is_streaming_candidate = classification_result.get('is_streaming_site', False)
@@ -190,16 +268,12 @@ class StreamingSiteSpider(scrapy.Spider):
             self.stats['classified_negative'] += 1
         
         # High-confidence streaming sites go to V2 verification pipeline
-        ai_threshold = self.config.get('v3_crawler_settings', {}).get('ai_confidence_threshold', 0.7)
-        
-        if ai_probability >= ai_threshold:
+        if ai_probability >= self.ai_threshold:
             logger.info(f"V3 -> V2 Verification Pipeline: {url} (confidence: {ai_probability:.3f})")
             self._verify_with_v2_pipeline(url, classification_result)
         
         # Focused Crawling: Extract and score links for continued crawling
-        max_depth = self.config.get('v3_crawler_settings', {}).get('max_crawl_depth', 3)
-        
-        if current_depth < max_depth:
+        if current_depth < self.max_depth:
             for next_request in self._extract_focused_links(response, current_depth):
                 yield next_request
         
@@ -222,9 +296,7 @@ class StreamingSiteSpider(scrapy.Spider):
             verification_result = verify_url(url, scout_instance=self.scout_instance)
             
             # V2 final verdict using existing threshold
-            v2_threshold = self.config.get('discovery_settings', {}).get('verification_confidence_threshold', 50)
-            
-            if verification_result['overall_confidence'] >= v2_threshold:
+            if verification_result['overall_confidence'] >= self.v2_threshold:
                 logger.info(f"V3 SUCCESS: {url} passed both AI and V2 verification")
                 self.stats['verified_sites'] += 1
                 
@@ -232,7 +304,7 @@ class StreamingSiteSpider(scrapy.Spider):
                 self.scout_instance._store_verified_site(url, verification_result)
                 
                 # Autonomous Feedback Loop: Add to crawl queue
-                if self.config.get('v3_crawler_settings', {}).get('enable_autonomous_feedback', True):
+                if self.enable_autonomous_feedback:
                     self._add_to_feedback_queue(url)
                 
             else:
@@ -247,7 +319,7 @@ class StreamingSiteSpider(scrapy.Spider):
         """
         Add successfully verified site to autonomous feedback queue.
         """
-        if url not in self.feedback_queue and url not in self.discovered_urls:
+        if url not in self.feedback_queue and _url_fingerprint(url) not in self.discovered_urls:
             self.feedback_queue.append(url)
             self.stats['new_seeds_added'] += 1
             logger.info(f"Autonomous Feedback: Added {url} to crawl queue")
@@ -255,91 +327,55 @@ class StreamingSiteSpider(scrapy.Spider):
     def _extract_focused_links(self, response, current_depth):
         """
         Intelligent link extraction with relevancy scoring.
+
+        Link extraction goes through Scrapy's LinkExtractor — one lxml pass
+        with URL resolution, canonicalization and dedup done in C — and the
+        selected links are batch-yielded via response.follow_all.
         """
-        links_found = response.css('a::attr(href)').getall()
-        scored_links = []
-        
-        for link in links_found:
-            try:
-                # Resolve relative URLs
-                full_url = urljoin(response.url, link)
-                
-                # Skip if already discovered
-                if full_url in self.discovered_urls:
-                    continue
-                
-                # Calculate relevancy score
-                relevancy_score = self._calculate_relevancy_score(link, full_url)
-                
-                # Check relevancy threshold
-                relevancy_threshold = self.config.get('v3_crawler_settings', {}).get('relevancy_threshold', 0.6)
-                
-                if relevancy_score >= relevancy_threshold:
-                    scored_links.append((full_url, relevancy_score))
-                
-            except Exception as e:
-                logger.debug(f"Error processing link {link}: {e}")
-        
-        # Sort by relevancy score and limit
-        scored_links.sort(key=lambda x: x[1], reverse=True)
-        
+        try:
+            links = self.LINK_EXTRACTOR.extract_links(response)
+        except Exception as e:
+            logger.debug(f"Link extraction failed for {response.url}: {e}")
+            return
+
+        # Score all of a page's candidates in one batched regex sweep rather
+        # than one scorer call per link. No Python-side dedup here: the
+        # engine's RFPDupeFilter already drops repeat requests at schedule
+        # time, so a second membership check per link is pure overhead
+        if not links:
+            return
+
+        texts, urls = zip(*((link.text, link.url) for link in links))
+        scores = score_link_batch(texts, urls)
+
+        scored_links = [
+            (urls[i], float(scores[i]))
+            for i in np.flatnonzero(scores >= self.relevancy_threshold)
+        ]
+
+        # Top-K selection: a page can yield hundreds of passing candidates
+        # but only max_links survive, so a bounded heap beats a full sort
         max_links = 10  # Limit links per page to maintain focus
-        
-        for url, score in scored_links[:max_links]:
-            if url not in self.discovered_urls:
-                self.discovered_urls.add(url)
-                
-                logger.debug(f"Focused Crawl: {url} (relevancy: {score:.2f})")
-                
-                yield scrapy.Request(
-                    url=url,
-                    callback=self.parse,
-                    meta={'depth': current_depth + 1, 'source': 'focused_crawl'},
-                    errback=self.handle_error
-                )
+
+        selected_urls = []
+        for url, score in heapq.nlargest(max_links, scored_links, key=lambda x: x[1]):
+            logger.debug(f"Focused Crawl: {url} (relevancy: {score:.2f})")
+            selected_urls.append(url)
+
+        yield from response.follow_all(
+            urls=selected_urls,
+            callback=self.parse,
+            meta={'depth': current_depth + 1, 'source': 'focused_crawl'},
+            errback=self.handle_error
+        )
     
     def _calculate_relevancy_score(self, link_text, url):
         """
         Calculate relevancy score for a link based on sports/streaming indicators.
+
+        Delegates to the shared single-pass scorer in relevancy.py.
         """
-        score = 0.0
-        
-        # Keyword scoring for anchor text and URL
-        streaming_keywords = ['live', 'stream', 'watch', 'tv', 'video', 'player', 'free']
-        sports_keywords = ['nfl', 'nba', 'nhl', 'mlb', 'soccer', 'football', 'basketball', 'sports']
-        
-        text_lower = link_text.lower() if link_text else ""
-        url_lower = url.lower()
-        
-        # Anchor text scoring
-        for keyword in streaming_keywords:
-            if keyword in text_lower:
-                score += 0.3
-        
-        for keyword in sports_keywords:
-            if keyword in text_lower:
-                score += 0.2
-        
-        # URL scoring
-        for keyword in streaming_keywords:
-            if keyword in url_lower:
-                score += 0.2
-        
-        for keyword in sports_keywords:
-            if keyword in url_lower:
-                score += 0.15
-        
-        # Bonus for specific streaming indicators
-        if any(indicator in url_lower for indicator in ['live', 'stream', 'watch']):
-            score += 0.1
-        
-        # Penalty for obviously non-streaming links
-        negative_indicators = ['privacy', 'terms', 'contact', 'about', 'dmca', 'legal']
-        for indicator in negative_indicators:
-            if indicator in url_lower or indicator in text_lower:
-                score -= 0.5
-        
-        return max(0.0, min(1.0, score))  # Clamp between 0 and 1
+        return calculate_relevancy_score(link_text, url)
     
     def handle_error(self, failure):
         """Handle request errors."""